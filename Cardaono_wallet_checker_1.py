@@ -1,66 +1,161 @@
 import os
 import requests
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from crewai import Agent, Task, Crew
 
+# Optional Numba-compiled summation for very large wallets (exchanges,
+# staking pools). Falls back to the pure-Python generator sums if numba
+# or numpy is not installed.
+try:
+    import numpy as np
+    from numba import njit, prange
+
+    @njit(cache=True, parallel=True)
+    def _sum_lovelace(quantities, locked_mask):
+        spendable = 0
+        locked = 0
+        for i in prange(quantities.shape[0]):
+            if locked_mask[i]:
+                locked += quantities[i]
+            else:
+                spendable += quantities[i]
+        return spendable, locked
+
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+# Below this many UTXOs the JIT/array-building overhead outweighs the win
+NUMBA_MIN_UTXOS = 1000
+
 # 🔹 **Setup Debug Logging**
 logging.basicConfig(
     filename="debug_cardano_wallet.log",
     level=logging.DEBUG,
     format="%(asctime)s - %(levelname)s - %(message)s"
 )
+logger = logging.getLogger(__name__)
 
 # **Set Blockfrost API Key**
 BLOCKFROST_API_KEY = os.getenv("BLOCKFROST_API_KEY")  # Ensure this is set in your environment
 API_URL = "https://cardano-mainnet.blockfrost.io/api/v0"
 
+# Blockfrost pagination: 100 UTXOs per page, up to 10 concurrent requests
+# on the free tier
+PAGE_SIZE = 100
+MAX_CONCURRENT_PAGES = 10
+
+# A Cardano slot is ~20 s; within that window repeated queries for the
+# same wallet return identical data, so serve them from memory instead of
+# burning Blockfrost rate-limit quota
+UTXO_CACHE_TTL = 20
+_utxo_cache = {}
+
+# User-facing messages for the HTTP statuses we know how to explain
+_HTTP_ERRORS = {
+    403: "❌ API Key is invalid or unauthorized. Check your Blockfrost API key.",
+    404: "❌ Wallet address not found. Ensure the address is correct.",
+}
+
+
+def _fetch_utxo_page(url, headers, page):
+    """Fetch one page of UTXOs, honoring Retry-After when rate limited."""
+    for attempt in range(3):
+        response = requests.get(url, headers=headers, params={"page": page, "count": PAGE_SIZE})
+        if response.status_code == 429:
+            delay = float(response.headers.get("Retry-After", 2 ** attempt))
+            logger.warning("⏳ Rate limited on page %s, retrying in %ss", page, delay)
+            time.sleep(delay)
+            continue
+        response.raise_for_status()
+        return response.json()
+    response.raise_for_status()
+    return response.json()
+
 
 def fetch_utxos(wallet_address):
     """Fetch UTXOs from the Cardano wallet and separate locked vs. spendable ADA."""
+    cached = _utxo_cache.get(wallet_address)
+    if cached and time.time() - cached[0] < UTXO_CACHE_TTL:
+        logger.debug("♻️ Serving UTXOs for %s from cache", wallet_address)
+        return cached[1]
+
     url = f"{API_URL}/addresses/{wallet_address}/utxos"
     headers = {"project_id": BLOCKFROST_API_KEY}
 
-    logging.debug(f"🔹 Sending request to Blockfrost API: {url}")
+    logger.debug("🔹 Sending request to Blockfrost API: %s", url)
 
     try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        utxos = response.json()
-
-        logging.debug(f"✅ Blockfrost API Response (UTXOs): {utxos}")
-
-        spendable_ada = 0
-        locked_ada = 0
-
-        # Analyze UTXOs
-        for utxo in utxos:
-            logging.debug(f"🔸 Processing UTXO: {utxo}")
-
-            for asset in utxo.get("amount", []):
-                if asset.get("unit") == "lovelace":
-                    ada_amount = int(asset["quantity"]) / 1_000_000  # Convert Lovelace to ADA
-
-                    # Check if UTXO is locked (heuristic: script reference present)
-                    if utxo.get("script"):
-                        locked_ada += ada_amount
-                        logging.debug(f"🔒 Locked ADA Found: {ada_amount} ADA")
-                    else:
-                        spendable_ada += ada_amount
-                        logging.debug(f"✅ Spendable ADA Found: {ada_amount} ADA")
-
-        logging.info(f"🔍 Final ADA Calculation: Spendable ADA = {spendable_ada}, Locked ADA = {locked_ada}")
-        return spendable_ada, locked_ada
+        # First page tells us whether the wallet needs pagination; further
+        # pages are probed concurrently in waves until a short page shows up
+        utxos = _fetch_utxo_page(url, headers, 1)
+        if len(utxos) == PAGE_SIZE:
+            page = 2
+            with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_PAGES) as pool:
+                while True:
+                    wave = range(page, page + MAX_CONCURRENT_PAGES)
+                    got_short_page = False
+                    for page_utxos in pool.map(lambda p: _fetch_utxo_page(url, headers, p), wave):
+                        utxos.extend(page_utxos)
+                        if len(page_utxos) < PAGE_SIZE:
+                            got_short_page = True
+                            break
+                    if got_short_page:
+                        break
+                    page += MAX_CONCURRENT_PAGES
+
+        # Guard the dump: repr-ing thousands of UTXO dicts is expensive
+        # even when DEBUG is off
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("✅ Blockfrost API Response (UTXOs): %s", utxos)
+
+        # Sum lovelace in integer space, partitioned by the locked heuristic
+        # (script reference present), and convert to ADA once at the end.
+        # One pass per partition beats the old per-asset loop with float
+        # division and per-UTXO debug logging.
+        if HAVE_NUMBA and len(utxos) >= NUMBA_MIN_UTXOS:
+            # Flatten the JSON into int64/bool arrays and let the compiled
+            # kernel do the summation
+            quantities = np.fromiter(
+                (int(asset["quantity"])
+                 for utxo in utxos
+                 for asset in utxo.get("amount", []) if asset.get("unit") == "lovelace"),
+                dtype=np.int64
+            )
+            locked_mask = np.fromiter(
+                (bool(utxo.get("script"))
+                 for utxo in utxos
+                 for asset in utxo.get("amount", []) if asset.get("unit") == "lovelace"),
+                dtype=np.bool_
+            )
+            spendable_lovelace, locked_lovelace = _sum_lovelace(quantities, locked_mask)
+        else:
+            locked_lovelace = sum(
+                int(asset["quantity"])
+                for utxo in utxos if utxo.get("script")
+                for asset in utxo.get("amount", []) if asset.get("unit") == "lovelace"
+            )
+            spendable_lovelace = sum(
+                int(asset["quantity"])
+                for utxo in utxos if not utxo.get("script")
+                for asset in utxo.get("amount", []) if asset.get("unit") == "lovelace"
+            )
+        spendable_ada = spendable_lovelace / 1_000_000  # Convert Lovelace to ADA
+        locked_ada = locked_lovelace / 1_000_000
+
+        logger.info("🔍 Final ADA Calculation: Spendable ADA = %s, Locked ADA = %s", spendable_ada, locked_ada)
+        result = (spendable_ada, locked_ada, None)
+        _utxo_cache[wallet_address] = (time.time(), result)  # Errors are never cached
+        return result
 
     except requests.exceptions.HTTPError as http_err:
-        logging.error(f"❌ HTTP Error: {http_err}")
-        if response.status_code == 403:
-            return None, None, "❌ API Key is invalid or unauthorized. Check your Blockfrost API key."
-        elif response.status_code == 404:
-            return None, None, "❌ Wallet address not found. Ensure the address is correct."
-        else:
-            return None, None, f"❌ API Request Failed: {http_err}"
+        logger.error("❌ HTTP Error: %s", http_err)
+        status_code = http_err.response.status_code if http_err.response is not None else None
+        return None, None, _HTTP_ERRORS.get(status_code, f"❌ API Request Failed: {http_err}")
     except requests.exceptions.RequestException as err:
-        logging.error(f"❌ Network Error: {err}")
+        logger.error("❌ Network Error: %s", err)
         return None, None, f"❌ Network error: {err}"
 
 
@@ -78,10 +173,10 @@ utxo_agent = Agent(
 # **2️⃣ ADA Reporting Agent**
 def report_ada_balance(wallet_address):
     """Retrieves and reports the locked and spendable ADA from the UTXO agent."""
-    spendable_ada, locked_ada = fetch_utxos(wallet_address)
+    spendable_ada, locked_ada, error = fetch_utxos(wallet_address)
 
     if spendable_ada is None:
-        return locked_ada  # If error message, return it
+        return error  # Error message explaining what went wrong
 
     # **Formatted List Display**
     balance_report = f"""
@@ -92,7 +187,7 @@ def report_ada_balance(wallet_address):
 💰 **Total ADA in Wallet:** {(spendable_ada + locked_ada):.6f} ADA
 --------------------------------
 """
-    logging.info(f"📊 ADA Balance Report Generated: {balance_report}")
+    logger.info("📊 ADA Balance Report Generated: %s", balance_report)
     return balance_report.strip()
 
 
@@ -1,15 +1,25 @@
+import functools
+import io
 import openai
+import re
 import time
 from typing import List, Dict
 import os
 import pygame
+import queue
 import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # Replace this with your actual OpenAI API key from https://platform.openai.com/account/api-keys
 OPENAI_API_KEY = "You_API_Key_Here"  # REPLACE WITH YOUR REAL KEY
 
+# Initialize the mixer once at import with OpenAI TTS's native output
+# format (24 kHz, 16-bit, mono) so SDL doesn't resample every clip
+pygame.mixer.pre_init(frequency=24000, size=-16, channels=1, buffer=1024)
+pygame.mixer.init()
+
 # Initialize OpenAI client
 try:
     openai_client = openai.OpenAI(api_key=OPENAI_API_KEY)
@@ -18,25 +28,47 @@ except Exception as e:
     exit(1)
 
 
+# Formatted once per agent; a byte-stable system prefix across exchanges
+# lets OpenAI's prompt caching kick in on the repeated portion
+SYSTEM_TEMPLATE = (
+    "You are {name}, a podcast {role} with a {personality} personality. "
+    "Respond naturally as your character would in a podcast discussion. "
+    "Summarize your thoughts concisely and engagingly, suitable for audio. "
+    "Ensure your response is complete, coherent, and fits the segment's purpose."
+)
+
+
 class PodcastAgent:
     def __init__(self, name: str, role: str, personality: str):
         self.name = name
         self.role = role
         self.personality = personality
+        self.system_prompt = SYSTEM_TEMPLATE.format(name=name, role=role, personality=personality)
         self.memory: List[Dict] = []
 
 
+@functools.lru_cache(maxsize=256)
+def _cached_topic_summary(topic: str) -> str:
+    """Fetch a topic summary from GPT-4, cached on the normalized topic.
+
+    Exceptions propagate so failed lookups are not cached.
+    """
+    prompt = f"Provide a concise summary of {topic} with 3 key facts suitable for a podcast discussion."
+    response = openai_client.chat.completions.create(
+        model="gpt-4",
+        messages=[{"role": "user", "content": prompt}],
+        max_tokens=200
+    )
+    return response.choices[0].message.content
+
+
 class ResearchAgent:
     def get_topic_info(self, topic: str) -> Dict:
         try:
-            prompt = f"Provide a concise summary of {topic} with 3 key facts suitable for a podcast discussion."
-            response = openai_client.chat.completions.create(
-                model="gpt-4",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=200
-            )
+            # Repeated topics (demos, reruns) hit the cache instead of
+            # paying for another GPT-4 call
             return {
-                "summary": response.choices[0].message.content,
+                "summary": _cached_topic_summary(topic.strip().lower()),
                 "timestamp": time.time()
             }
         except Exception as e:
@@ -44,67 +76,114 @@ class ResearchAgent:
             return {"summary": f"Error researching {topic}", "timestamp": time.time()}
 
 
+def _chunk_text(text: str, max_chars: int = 250) -> List[str]:
+    """Split text into chunks of up to max_chars at sentence boundaries"""
+    sentences = re.split(r'(?<=[.!?])\s+', text)
+    chunks = []
+    current = ""
+    for sentence in sentences:
+        if current and len(current) + len(sentence) + 1 > max_chars:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}".strip()
+    if current:
+        chunks.append(current)
+    return chunks
+
+
 class ConversationManager:
     def __init__(self):
         self.host = PodcastAgent("Alex", "host", "Friendly, curious, keeps conversation flowing")
         self.guest = PodcastAgent("Sam", "expert", "Knowledgeable, confident, occasional humor")
         self.researcher = ResearchAgent()
         self.current_topic = None
-        pygame.mixer.init()
 
-    def generate_speech(self, text: str, voice: str) -> str:
+    def _tts_request(self, text: str, voice: str) -> bytes:
+        """Render one TTS call and return the raw MP3 bytes"""
+        buffer = io.BytesIO()
+        with openai_client.audio.speech.with_streaming_response.create(
+                model="tts-1",
+                voice=voice,
+                input=text
+        ) as response:
+            for chunk in response.iter_bytes():
+                buffer.write(chunk)
+        return buffer.getvalue()
+
+    def generate_speech(self, text: str, voice: str) -> io.BytesIO:
+        """Render TTS audio into an in-memory buffer, skipping the disk round-trip.
+
+        Long responses are split at sentence boundaries and rendered as
+        concurrent TTS calls, so total render time is closer to the longest
+        chunk than the sum of all of them. OpenAI MP3 frames concatenate
+        cleanly, so the chunks are simply joined in order.
+        """
         try:
-            audio_file = f"output_{int(time.time())}.mp3"
             print(f"TTS Input Text ({len(text)} chars): {text}")
-            with openai_client.audio.speech.with_streaming_response.create(
-                    model="tts-1",
-                    voice=voice,
-                    input=text
-            ) as response:
-                with open(audio_file, "wb") as f:
-                    for chunk in response.iter_bytes():
-                        f.write(chunk)
-            return audio_file
+            if len(text) > 250:
+                chunks = _chunk_text(text)
+                with ThreadPoolExecutor(max_workers=min(4, len(chunks))) as pool:
+                    rendered = pool.map(lambda c: self._tts_request(c, voice), chunks)
+                    audio = b"".join(rendered)
+            else:
+                audio = self._tts_request(text, voice)
+            return io.BytesIO(audio)
         except Exception as e:
             print(f"TTS error: {e}")
             return None
 
-    def play_audio(self, audio_file: str):
-        if not audio_file:
+    def play_audio(self, audio_buffer: io.BytesIO):
+        if not audio_buffer:
             return
         try:
-            sound = pygame.mixer.Sound(audio_file)
-            duration_ms = sound.get_length() * 1000
+            # pygame accepts a file-like object, so play straight from memory
+            sound = pygame.mixer.Sound(file=audio_buffer)
 
             channel = sound.play()
             if channel:
-                pygame.time.wait(int(duration_ms))
+                # Poll the channel instead of blocking on the full clip
+                # duration, so the producer threads keep getting scheduled
+                # while audio plays
+                while channel.get_busy():
+                    pygame.time.wait(50)
             sound.stop()
-            time.sleep(0.01)
-            os.remove(audio_file)
         except Exception as e:
             print(f"Audio playback error: {e}")
-            try:
-                os.remove(audio_file)
-            except:
-                pass
 
     def generate_response(self, agent: PodcastAgent, context: str, max_tokens: int) -> str:
         try:
-            prompt = f"""
-            You are {agent.name}, a podcast {agent.role} with a {agent.personality} personality.
-            Given the conversation context: '{context}'
-            Respond naturally as your character would in a podcast discussion about {self.current_topic}.
-            Summarize your thoughts concisely and engagingly within {max_tokens} tokens,
-            suitable for audio. Ensure your response is complete, coherent, and fits the segment's purpose.
-            """
+            # Only the per-exchange details go in the user message; the
+            # system prompt is the agent's precomputed stable prefix
+            user_prompt = (
+                f"The discussion topic is {self.current_topic}.\n"
+                f"Conversation context: '{context}'\n"
+                f"Respond within {max_tokens} tokens."
+            )
             response = openai_client.chat.completions.create(
                 model="gpt-4",
-                messages=[{"role": "system", "content": prompt}],
-                max_tokens=max_tokens
+                messages=[
+                    {"role": "system", "content": agent.system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                max_tokens=max_tokens,
+                stream=True
             )
-            full_text = response.choices[0].message.content
-            print(f"Generated Text ({len(full_text)} chars, max {max_tokens} tokens): {full_text}")
+
+            # Accumulate streamed tokens and echo them as they arrive, so
+            # the console shows progress instead of a multi-second pause
+            # per exchange
+            print(f"Generating for {agent.name}: ", end="", flush=True)
+            parts = []
+            for chunk in response:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    print(delta, end="", flush=True)
+            print()
+
+            full_text = "".join(parts)
+            print(f"Generated Text ({len(full_text)} chars, max {max_tokens} tokens)")
             return full_text
         except Exception as e:
             print(f"Response generation error: {e}")
@@ -121,50 +200,59 @@ class ConversationManager:
         middle_tokens_per_exchange = middle_tokens_total // (MIN_EXCHANGES * 2)
         end_tokens = int(total_tokens * 0.30)
 
-        # Pre-generate all content
-        print("Pre-generating all podcast content...")
-        audio_files = []
-
-        # Beginning
-        research_data = self.researcher.get_topic_info(topic)
-        context = f"Starting discussion with research: {research_data['summary']}"
-        host_opening_text = self.generate_response(self.host, f"Starting a new episode about {topic}", intro_tokens)
-        host_opening_audio = self.generate_speech(host_opening_text, "alloy")
-        audio_files.append((self.host.name, host_opening_text, host_opening_audio))
-
-        # Middle
-        exchange_count = 0
-        while exchange_count < MIN_EXCHANGES and time.time() < end_time:
-            guest_response_text = self.generate_response(self.guest, context, middle_tokens_per_exchange)
-            guest_response_audio = self.generate_speech(guest_response_text, "echo")
-            audio_files.append((self.guest.name, guest_response_text, guest_response_audio))
-
-            context = f"Guest said: {guest_response_text}"
-            host_response_text = self.generate_response(self.host, context, middle_tokens_per_exchange)
-            host_response_audio = self.generate_speech(host_response_text, "alloy")
-            audio_files.append((self.host.name, host_response_text, host_response_audio))
-
-            context = f"Host said: {host_response_text}"
-            exchange_count += 1
-
-        # End
-        closing_text = self.generate_response(self.host, f"Wrapping up the episode about {topic}", end_tokens)
-        closing_audio = self.generate_speech(closing_text, "alloy")
-        audio_files.append((self.host.name, closing_text, closing_audio))
-
-        # Play the episode
-        print("Playing podcast episode...")
-        for speaker, text, audio_file in audio_files:
+        # Pipeline the episode: a producer thread generates text and submits
+        # TTS to a small worker pool while the main thread plays finished
+        # audio, so synthesis for segment N+1 overlaps playback of segment N.
+        audio_q = queue.Queue(maxsize=4)
+
+        def produce_segments():
+            try:
+                with ThreadPoolExecutor(max_workers=2) as tts_pool:
+                    def queue_segment(speaker, text, voice):
+                        audio_q.put((speaker, text, tts_pool.submit(self.generate_speech, text, voice)))
+
+                    # Beginning
+                    research_data = self.researcher.get_topic_info(topic)
+                    context = f"Starting discussion with research: {research_data['summary']}"
+                    host_opening_text = self.generate_response(self.host, f"Starting a new episode about {topic}",
+                                                              intro_tokens)
+                    queue_segment(self.host.name, host_opening_text, "alloy")
+
+                    # Middle
+                    exchange_count = 0
+                    while exchange_count < MIN_EXCHANGES and time.time() < end_time:
+                        guest_response_text = self.generate_response(self.guest, context, middle_tokens_per_exchange)
+                        queue_segment(self.guest.name, guest_response_text, "echo")
+
+                        context = f"Guest said: {guest_response_text}"
+                        host_response_text = self.generate_response(self.host, context, middle_tokens_per_exchange)
+                        queue_segment(self.host.name, host_response_text, "alloy")
+
+                        context = f"Host said: {host_response_text}"
+                        exchange_count += 1
+
+                    # End
+                    closing_text = self.generate_response(self.host, f"Wrapping up the episode about {topic}",
+                                                          end_tokens)
+                    queue_segment(self.host.name, closing_text, "alloy")
+            finally:
+                audio_q.put(None)  # Signal end of episode
+
+        print("Generating and playing podcast episode...")
+        threading.Thread(target=produce_segments, daemon=True).start()
+
+        while True:
+            segment = audio_q.get()
+            if segment is None:
+                break
+            speaker, text, audio_future = segment
             print(f"{speaker}: {text}")
-            self.play_audio(audio_file)
+            self.play_audio(audio_future.result())
             if speaker == self.host.name:
                 self.host.memory.append({"text": text, "topic": topic})
             else:
                 self.guest.memory.append({"text": text, "topic": topic})
 
-    def __del__(self):
-        pygame.mixer.quit()
-
 
 class PodcastUI:
     def __init__(self):
@@ -178,6 +266,7 @@ class PodcastUI:
         self.topic_entry = tk.Text(self.root, height=4, width=40)
         self.topic_entry.pack(pady=5)
         self.topic_entry.config(wrap="word")
+        self.topic_entry.bind("<KeyPress>", self.block_excess_chars)
         self.topic_entry.bind("<KeyRelease>", self.limit_chars)
 
         self.token_label = ttk.Label(self.root, text="Total Tokens for Podcast (100-5000):")
@@ -194,11 +283,25 @@ class PodcastUI:
 
         self.root.mainloop()
 
+    def block_excess_chars(self, event):
+        """Reject printable keystrokes at the cap instead of trimming after the fact.
+
+        Uses the widget's C-level character count, so typing stays O(1)
+        with no get/delete/insert round-trip or reflow.
+        """
+        if not event.char or event.char in ("\x08", "\x7f"):
+            return None  # Always allow navigation, backspace and delete
+        count = self.topic_entry.count("1.0", "end-1c", "chars")
+        if count and count[0] >= 999:
+            return "break"
+        return None
+
     def limit_chars(self, event):
-        content = self.topic_entry.get("1.0", tk.END)
-        if len(content) > 999:
-            self.topic_entry.delete("1.0", tk.END)
-            self.topic_entry.insert("1.0", content[:999])
+        # Safety net for pastes: only trim the overflow, and only when
+        # actually over the cap
+        count = self.topic_entry.count("1.0", "end-1c", "chars")
+        if count and count[0] > 999:
+            self.topic_entry.delete("1.0 + 999 chars", tk.END)
 
     def start_podcast(self):
         topic = self.topic_entry.get("1.0", tk.END).strip()
@@ -1,7 +1,11 @@
 import os
 import argparse
+import asyncio
 import json
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Any, Dict, List, Optional, Union
 from crewai import Agent, Task, Crew, Process
 from crewai.tools import BaseTool
@@ -30,6 +34,67 @@ debug_print(f"OpenAI API key set: {bool(OPENAI_API_KEY)}")
 debug_print(f"Grok API key set: {bool(GROK_API_KEY)}")
 debug_print(f"Google API key set: {bool(GOOGLE_API_KEY)}")
 
+# Shared session so repeated calls reuse TCP+TLS connections instead of
+# paying a fresh handshake per request
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+))
+
+# (connect, read) timeouts for all API calls
+REQUEST_TIMEOUT = (3.05, 30)
+
+# orjson serializes/deserializes ~4x faster than the stdlib and produces
+# bytes directly; fall back to json if it isn't installed
+try:
+    import orjson
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj)
+
+    def _json_loads(data):
+        return orjson.loads(data)
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj).encode()
+
+    def _json_loads(data):
+        return json.loads(data)
+
+
+# Constant headers and body templates per provider — only the messages
+# change between calls, so everything else is built once at import
+_CLAUDE_HEADERS = {
+    "x-api-key": ANTHROPIC_API_KEY,
+    "anthropic-version": "2023-06-01",
+    "content-type": "application/json"
+}
+_CLAUDE_BASE = {"model": "claude-3-opus-20240229", "max_tokens": 1000}
+
+_OPENAI_HEADERS = {
+    "Authorization": f"Bearer {OPENAI_API_KEY}",
+    "Content-Type": "application/json"
+}
+_GPT_BASE = {"model": "gpt-4", "max_tokens": 1000}
+
+_GROK_HEADERS = {
+    "Authorization": f"Bearer {GROK_API_KEY}",
+    "Content-Type": "application/json"
+}
+_GROK_BASE = {"model": "mixtral-8x7b-32768", "max_tokens": 1000}
+
+_GEMINI_HEADERS = {"Content-Type": "application/json"}
+_GEMINI_BASE = {
+    "generationConfig": {
+        "temperature": 0.7,
+        "maxOutputTokens": 1000,
+        "topP": 0.8,
+        "topK": 40
+    }
+}
+
 
 # Define custom tool classes with proper type annotations
 class ClaudeTool(BaseTool):
@@ -41,31 +106,20 @@ class ClaudeTool(BaseTool):
         try:
             debug_print(f"Sending request to Claude API with prompt: {prompt[:50]}...")
 
-            headers = {
-                "x-api-key": ANTHROPIC_API_KEY,
-                "anthropic-version": "2023-06-01",
-                "content-type": "application/json"
-            }
-
-            data = {
-                "model": "claude-3-opus-20240229",
-                "max_tokens": 1000,
-                "messages": [
-                    {"role": "user", "content": prompt}
-                ]
-            }
+            body = {**_CLAUDE_BASE, "messages": [{"role": "user", "content": prompt}]}
 
             debug_print("Making request to Anthropic API...")
-            response = requests.post(
+            response = SESSION.post(
                 "https://api.anthropic.com/v1/messages",
-                headers=headers,
-                json=data
+                headers=_CLAUDE_HEADERS,
+                data=_json_dumps(body),
+                timeout=REQUEST_TIMEOUT
             )
 
             debug_print(f"Claude API response status: {response.status_code}")
 
             if response.status_code == 200:
-                result = response.json()
+                result = _json_loads(response.content)
                 debug_print(f"Claude API response: {str(result)[:200]}...")
                 return "ANTHROPIC CLAUDE:\n\n" + result["content"][0]["text"]
             else:
@@ -77,6 +131,24 @@ class ClaudeTool(BaseTool):
             debug_print(error_msg)
             return "ANTHROPIC CLAUDE:\n\n" + error_msg
 
+    async def _arun(self, prompt: str, client: httpx.AsyncClient) -> str:
+        """Async version of _run sharing one multiplexed httpx client"""
+        try:
+            body = {**_CLAUDE_BASE, "messages": [{"role": "user", "content": prompt}]}
+
+            response = await client.post(
+                "https://api.anthropic.com/v1/messages",
+                headers=_CLAUDE_HEADERS,
+                content=_json_dumps(body)
+            )
+
+            if response.status_code == 200:
+                result = _json_loads(response.content)
+                return "ANTHROPIC CLAUDE:\n\n" + result["content"][0]["text"]
+            return "ANTHROPIC CLAUDE:\n\n" + f"Error from Claude API: Status {response.status_code}, {response.text}"
+        except Exception as e:
+            return "ANTHROPIC CLAUDE:\n\n" + f"Error with Claude API: {str(e)}"
+
 
 class GPTTool(BaseTool):
     name: str = "AskGPT"
@@ -87,31 +159,23 @@ class GPTTool(BaseTool):
         try:
             debug_print(f"Sending request to OpenAI API with prompt: {prompt[:50]}...")
 
-            headers = {
-                "Authorization": f"Bearer {OPENAI_API_KEY}",
-                "Content-Type": "application/json"
-            }
-
-            data = {
-                "model": "gpt-4",
-                "messages": [
-                    {"role": "system", "content": "You are a helpful assistant."},
-                    {"role": "user", "content": prompt}
-                ],
-                "max_tokens": 1000
-            }
+            body = {**_GPT_BASE, "messages": [
+                {"role": "system", "content": "You are a helpful assistant."},
+                {"role": "user", "content": prompt}
+            ]}
 
             debug_print("Making request to OpenAI API...")
-            response = requests.post(
+            response = SESSION.post(
                 "https://api.openai.com/v1/chat/completions",
-                headers=headers,
-                json=data
+                headers=_OPENAI_HEADERS,
+                data=_json_dumps(body),
+                timeout=REQUEST_TIMEOUT
             )
 
             debug_print(f"OpenAI API response status: {response.status_code}")
 
             if response.status_code == 200:
-                result = response.json()
+                result = _json_loads(response.content)
                 debug_print(f"OpenAI API response: {str(result)[:200]}...")
                 return "OPENAI GPT:\n\n" + result["choices"][0]["message"]["content"]
             else:
@@ -123,6 +187,27 @@ class GPTTool(BaseTool):
             debug_print(error_msg)
             return "OPENAI GPT:\n\n" + error_msg
 
+    async def _arun(self, prompt: str, client: httpx.AsyncClient) -> str:
+        """Async version of _run sharing one multiplexed httpx client"""
+        try:
+            body = {**_GPT_BASE, "messages": [
+                {"role": "system", "content": "You are a helpful assistant."},
+                {"role": "user", "content": prompt}
+            ]}
+
+            response = await client.post(
+                "https://api.openai.com/v1/chat/completions",
+                headers=_OPENAI_HEADERS,
+                content=_json_dumps(body)
+            )
+
+            if response.status_code == 200:
+                result = _json_loads(response.content)
+                return "OPENAI GPT:\n\n" + result["choices"][0]["message"]["content"]
+            return "OPENAI GPT:\n\n" + f"Error from OpenAI API: Status {response.status_code}, {response.text}"
+        except Exception as e:
+            return "OPENAI GPT:\n\n" + f"Error with OpenAI API: {str(e)}"
+
 
 class GrokTool(BaseTool):
     name: str = "AskGrok"
@@ -135,32 +220,24 @@ class GrokTool(BaseTool):
 
             # Note: For Grok, we're still using Groq's API endpoint as a substitute
             # Since direct Grok API access is limited
-            headers = {
-                "Authorization": f"Bearer {GROK_API_KEY}",
-                "Content-Type": "application/json"
-            }
-
-            data = {
-                "model": "mixtral-8x7b-32768",  # Using an appropriate model
-                "messages": [
-                    {"role": "system", "content": "You are a helpful assistant."},
-                    {"role": "user", "content": prompt}
-                ],
-                "max_tokens": 1000
-            }
+            body = {**_GROK_BASE, "messages": [
+                {"role": "system", "content": "You are a helpful assistant."},
+                {"role": "user", "content": prompt}
+            ]}
 
             debug_print("Making request to Grok API...")
-            response = requests.post(
+            response = SESSION.post(
                 "https://api.groq.com/openai/v1/chat/completions",
                 # This might need to be updated to Grok's actual endpoint
-                headers=headers,
-                json=data
+                headers=_GROK_HEADERS,
+                data=_json_dumps(body),
+                timeout=REQUEST_TIMEOUT
             )
 
             debug_print(f"Grok API response status: {response.status_code}")
 
             if response.status_code == 200:
-                result = response.json()
+                result = _json_loads(response.content)
                 debug_print(f"Grok API response: {str(result)[:200]}...")
                 return "GROK:\n\n" + result["choices"][0]["message"]["content"]
             else:
@@ -172,6 +249,27 @@ class GrokTool(BaseTool):
             debug_print(error_msg)
             return "GROK:\n\n" + error_msg
 
+    async def _arun(self, prompt: str, client: httpx.AsyncClient) -> str:
+        """Async version of _run sharing one multiplexed httpx client"""
+        try:
+            body = {**_GROK_BASE, "messages": [
+                {"role": "system", "content": "You are a helpful assistant."},
+                {"role": "user", "content": prompt}
+            ]}
+
+            response = await client.post(
+                "https://api.groq.com/openai/v1/chat/completions",
+                headers=_GROK_HEADERS,
+                content=_json_dumps(body)
+            )
+
+            if response.status_code == 200:
+                result = _json_loads(response.content)
+                return "GROK:\n\n" + result["choices"][0]["message"]["content"]
+            return "GROK:\n\n" + f"Error from Grok API: Status {response.status_code}, {response.text}"
+        except Exception as e:
+            return "GROK:\n\n" + f"Error with Grok API: {str(e)}"
+
 
 class GeminiTool(BaseTool):
     name: str = "AskGemini"
@@ -184,39 +282,20 @@ class GeminiTool(BaseTool):
 
             api_url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-pro:generateContent?key={GOOGLE_API_KEY}"
 
-            headers = {
-                "Content-Type": "application/json"
-            }
-
-            data = {
-                "contents": [
-                    {
-                        "parts": [
-                            {
-                                "text": prompt
-                            }
-                        ]
-                    }
-                ],
-                "generationConfig": {
-                    "temperature": 0.7,
-                    "maxOutputTokens": 1000,
-                    "topP": 0.8,
-                    "topK": 40
-                }
-            }
+            body = {**_GEMINI_BASE, "contents": [{"parts": [{"text": prompt}]}]}
 
             debug_print("Making request to Google Gemini API...")
-            response = requests.post(
+            response = SESSION.post(
                 api_url,
-                headers=headers,
-                json=data
+                headers=_GEMINI_HEADERS,
+                data=_json_dumps(body),
+                timeout=REQUEST_TIMEOUT
             )
 
             debug_print(f"Gemini API response status: {response.status_code}")
 
             if response.status_code == 200:
-                result = response.json()
+                result = _json_loads(response.content)
                 debug_print(f"Gemini API response: {str(result)[:200]}...")
 
                 # Extract the text from Gemini's response format
@@ -234,6 +313,30 @@ class GeminiTool(BaseTool):
             debug_print(error_msg)
             return "GOOGLE GEMINI:\n\n" + error_msg
 
+    async def _arun(self, prompt: str, client: httpx.AsyncClient) -> str:
+        """Async version of _run sharing one multiplexed httpx client"""
+        try:
+            api_url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-pro:generateContent?key={GOOGLE_API_KEY}"
+
+            body = {**_GEMINI_BASE, "contents": [{"parts": [{"text": prompt}]}]}
+
+            response = await client.post(
+                api_url,
+                headers=_GEMINI_HEADERS,
+                content=_json_dumps(body)
+            )
+
+            if response.status_code == 200:
+                result = _json_loads(response.content)
+                try:
+                    text = result["candidates"][0]["content"]["parts"][0]["text"]
+                    return "GOOGLE GEMINI:\n\n" + text
+                except (KeyError, IndexError) as e:
+                    return f"GOOGLE GEMINI:\n\nError parsing Gemini response: {str(e)}\nRaw response: {str(result)[:500]}"
+            return "GOOGLE GEMINI:\n\n" + f"Error from Gemini API: Status {response.status_code}, {response.text}"
+        except Exception as e:
+            return "GOOGLE GEMINI:\n\n" + f"Error with Gemini API: {str(e)}"
+
 
 # Create direct functions to test the APIs outside of CrewAI
 def test_claude_api(prompt):
@@ -263,104 +366,87 @@ grok_tool = GrokTool()
 gemini_tool = GeminiTool()
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Get responses from multiple LLM agents")
-    parser.add_argument("prompt", nargs="?", help="The prompt to send to the LLMs")
-    parser.add_argument("--test", action="store_true", help="Test APIs directly without CrewAI")
-    args = parser.parse_args()
-
-    # Get prompt from command line or user input
-    user_prompt = args.prompt
-    if not user_prompt:
-        user_prompt = input("Enter your prompt: ")
-
-    print(f"\nSending prompt to all LLMs: \"{user_prompt}\"\n")
-
-    # Test APIs directly if --test flag is used
-    if args.test:
-        print("Testing APIs directly...\n")
-
-        print("\n=== ANTHROPIC CLAUDE ===\n")
-        claude_response = test_claude_api(user_prompt)
-        print(claude_response)
-
-        print("\n=== OPENAI GPT ===\n")
-        gpt_response = test_openai_api(user_prompt)
-        print(gpt_response)
-
-        print("\n=== GROK ===\n")
-        grok_response = test_grok_api(user_prompt)
-        print(grok_response)
-
-        print("\n=== GOOGLE GEMINI ===\n")
-        gemini_response = test_gemini_api(user_prompt)
-        print(gemini_response)
-
-        return
-
-    print("Generating responses using CrewAI...\n")
-
-    try:
-        # Create the agents with tools
-        claude_agent = Agent(
-            role="Claude Language Model",
-            goal="Provide the best possible response to the user's prompt",
-            backstory="You are Claude, an AI assistant created by Anthropic, known for thoughtful and nuanced responses.",
-            tools=[claude_tool],
-            verbose=True
+async def _gather_all(prompt):
+    """Query all four providers concurrently over one HTTP/2 client"""
+    async with httpx.AsyncClient(http2=True, timeout=30) as client:
+        return await asyncio.gather(
+            claude_tool._arun(prompt, client),
+            gpt_tool._arun(prompt, client),
+            grok_tool._arun(prompt, client),
+            gemini_tool._arun(prompt, client)
         )
 
-        gpt_agent = Agent(
-            role="GPT Language Model",
-            goal="Provide the best possible response to the user's prompt",
-            backstory="You are GPT, an AI assistant created by OpenAI, known for versatile and creative responses.",
-            tools=[gpt_tool],
-            verbose=True
-        )
-
-        grok_agent = Agent(
-            role="Grok Language Model",
-            goal="Provide the best possible response to the user's prompt",
-            backstory="You are Grok, an AI assistant created by xAI, providing efficient and knowledgeable responses.",
-            tools=[grok_tool],
-            verbose=True
-        )
-
-        gemini_agent = Agent(
-            role="Gemini Language Model",
-            goal="Provide the best possible response to the user's prompt",
-            backstory="You are Gemini, an AI assistant created by Google, known for helpful and accurate responses.",
-            tools=[gemini_tool],
-            verbose=True
-        )
 
+# The agents are Pydantic models with non-trivial validation, so build
+# them once at module scope instead of on every prompt
+claude_agent = Agent(
+    role="Claude Language Model",
+    goal="Provide the best possible response to the user's prompt",
+    backstory="You are Claude, an AI assistant created by Anthropic, known for thoughtful and nuanced responses.",
+    tools=[claude_tool],
+    verbose=True
+)
+
+gpt_agent = Agent(
+    role="GPT Language Model",
+    goal="Provide the best possible response to the user's prompt",
+    backstory="You are GPT, an AI assistant created by OpenAI, known for versatile and creative responses.",
+    tools=[gpt_tool],
+    verbose=True
+)
+
+grok_agent = Agent(
+    role="Grok Language Model",
+    goal="Provide the best possible response to the user's prompt",
+    backstory="You are Grok, an AI assistant created by xAI, providing efficient and knowledgeable responses.",
+    tools=[grok_tool],
+    verbose=True
+)
+
+gemini_agent = Agent(
+    role="Gemini Language Model",
+    goal="Provide the best possible response to the user's prompt",
+    backstory="You are Gemini, an AI assistant created by Google, known for helpful and accurate responses.",
+    tools=[gemini_tool],
+    verbose=True
+)
+
+
+def answer(user_prompt):
+    """Run the four-agent crew for one prompt and return the CrewAI result.
+
+    Only the Tasks are rebuilt per prompt (their descriptions bind the
+    prompt text); the agents are reused from module scope, so this is
+    cheap to call repeatedly when embedding the script.
+    """
+    try:
         # Create tasks with expected_output field
         claude_task = Task(
             description=f"Use the AskClaude tool to respond to this prompt: {user_prompt}",
             agent=claude_agent,
             expected_output="A comprehensive response from Anthropic's Claude",
-            async_execution=False
+            async_execution=True
         )
 
         gpt_task = Task(
             description=f"Use the AskGPT tool to respond to this prompt: {user_prompt}",
             agent=gpt_agent,
             expected_output="A comprehensive response from OpenAI's GPT",
-            async_execution=False
+            async_execution=True
         )
 
         grok_task = Task(
             description=f"Use the AskGrok tool to respond to this prompt: {user_prompt}",
             agent=grok_agent,
             expected_output="A comprehensive response from Grok",
-            async_execution=False
+            async_execution=True
         )
 
         gemini_task = Task(
             description=f"Use the AskGemini tool to respond to this prompt: {user_prompt}",
             agent=gemini_agent,
             expected_output="A comprehensive response from Google's Gemini",
-            async_execution=False
+            async_execution=False  # CrewAI needs the final task to run synchronously
         )
 
         # Create and run the crew
@@ -368,7 +454,7 @@ def main():
             agents=[claude_agent, gpt_agent, grok_agent, gemini_agent],
             tasks=[claude_task, gpt_task, grok_task, gemini_task],
             verbose=True,
-            process=Process.sequential  # Run tasks one after another
+            process=Process.sequential  # Async tasks still overlap; only the final task blocks
         )
 
         # Run the crew
@@ -392,6 +478,37 @@ def main():
         return None
 
 
+def main():
+    parser = argparse.ArgumentParser(description="Get responses from multiple LLM agents")
+    parser.add_argument("prompt", nargs="?", help="The prompt to send to the LLMs")
+    parser.add_argument("--test", action="store_true", help="Test APIs directly without CrewAI")
+    args = parser.parse_args()
+
+    # Get prompt from command line or user input
+    user_prompt = args.prompt
+    if not user_prompt:
+        user_prompt = input("Enter your prompt: ")
+
+    print(f"\nSending prompt to all LLMs: \"{user_prompt}\"\n")
+
+    # Test APIs directly if --test flag is used
+    if args.test:
+        print("Testing APIs directly...\n")
+
+        # The four providers are independent, so fan the calls out over a
+        # single multiplexed HTTP/2 client. Each response string is already
+        # prefixed with its provider name.
+        for response in asyncio.run(_gather_all(user_prompt)):
+            print("\n" + "=" * 50 + "\n")
+            print(response)
+
+        return
+
+    print("Generating responses using CrewAI...\n")
+
+    return answer(user_prompt)
+
+
 if __name__ == "__main__":
     main()
  
@@ -4,6 +4,8 @@ import json
 import logging
 import re
 import openai
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
 
 # Set up logging
 logging.basicConfig(
@@ -19,6 +21,57 @@ OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 # Set the OpenAI API key
 openai.api_key = OPENAI_API_KEY
 
+# One OpenAI client for the whole process, so the connection pool to
+# api.openai.com is reused instead of re-handshaking TLS on every summary
+try:
+    _OAI_CLIENT = openai.OpenAI(api_key=OPENAI_API_KEY) if OPENAI_API_KEY else None
+except AttributeError:
+    # Older openai library without the client class
+    _OAI_CLIENT = None
+
+# Which chat-completion entry point this openai version provides is known
+# at import time, so resolve it once instead of branching per call
+if _OAI_CLIENT is not None:
+    _chat_create = _OAI_CLIENT.chat.completions.create
+elif hasattr(openai, "ChatCompletion"):
+    _chat_create = openai.ChatCompletion.create
+else:
+    _chat_create = None  # No API key; generate_summary bails out early
+
+# One session for all HTTP calls, so repeated requests to the Google API
+# and the place's website reuse TCP+TLS connections
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": "Mozilla/5.0"})
+
+# Google's hours strings use narrow/thin spaces and en dashes; one
+# C-level translate pass maps them to ASCII so the hours regex stays a
+# simple pattern with no catch-all character classes to backtrack over
+_WS_MAP = str.maketrans({"\u202f": " ", "\u2009": " ", "\u00a0": " ", "\u2013": "-", "\u2014": "-"})
+
+# Precompiled patterns, compiled once at import instead of on every call
+_HOURS_RE = re.compile(
+    r"(\d{1,2}:\d{2})\s*(AM|PM|am|pm)\s*-\s*(\d{1,2}:\d{2})\s*(AM|PM|am|pm)")
+# Prefer RE2 for the pattern that runs on untrusted page HTML: it matches
+# in linear time, so adversarial input can't trigger pathological
+# backtracking. Next best is the PyPI `regex` module, whose timeout=
+# bounds a scan that does backtrack; the stdlib engine is the last
+# resort. The tiny, trusted hours pattern stays on the stdlib engine.
+try:
+    import re2 as _social_re
+    _SOCIAL_SCAN_ARGS = {}
+except ImportError:
+    try:
+        import regex as _social_re
+        _SOCIAL_SCAN_ARGS = {"timeout": 0.5}
+    except ImportError:
+        _social_re = re
+        _SOCIAL_SCAN_ARGS = {}
+
+# One alternation scans the HTML a single time for all platforms
+_SOCIAL_RE = _social_re.compile(
+    r'https?://(?:www\.)?(?P<host>facebook|instagram|twitter|x)\.com/[^\s"\'<>]+', re.IGNORECASE)
+_HOST_TO_KEY = {"facebook": "Facebook", "instagram": "Instagram", "twitter": "Twitter/X", "x": "Twitter/X"}
+
 
 def get_place_details(place_name, location):
     """Search for a place using Google Places Text Search API."""
@@ -26,7 +79,7 @@ def get_place_details(place_name, location):
     query = f"{place_name}, {location}"
     params = {"query": query, "key": GOOGLE_API_KEY}
 
-    response = requests.get(endpoint, params=params)
+    response = _SESSION.get(endpoint, params=params)
     if response.status_code == 200:
         result = response.json()
         if result.get("status") == "OK" and result.get("results"):
@@ -49,7 +102,7 @@ def get_place_info(place_id):
         "key": GOOGLE_API_KEY
     }
 
-    details_response = requests.get(details_endpoint, params=details_params)
+    details_response = _SESSION.get(details_endpoint, params=details_params)
     if details_response.status_code == 200:
         place_details = details_response.json()
         if place_details.get("status") == "OK":
@@ -62,11 +115,20 @@ def get_place_info(place_id):
                 "address": details.get("formatted_address", "N/A"),
                 "website": website,
                 "hours": format_opening_hours(details.get("opening_hours", {}).get("weekday_text", [])),
-                "social_media": get_social_media_links(website) if website != "N/A" else "No website available"
             }
 
-            # Generate a 100-word summary and add it to our dictionary
-            place_info["summary"] = generate_summary(place_info)
+            # The social scrape and the 100-word summary are independent,
+            # so overlap them in a small thread pool; the summary prompt
+            # simply omits the social links
+            if website != "N/A":
+                with ThreadPoolExecutor(max_workers=2) as pool:
+                    social_future = pool.submit(get_social_media_links, website)
+                    summary_future = pool.submit(generate_summary, place_info)
+                    place_info["social_media"] = social_future.result()
+                    place_info["summary"] = summary_future.result()
+            else:
+                place_info["social_media"] = "No website available"
+                place_info["summary"] = generate_summary(place_info)
 
             return place_info
         else:
@@ -89,11 +151,10 @@ def format_opening_hours(hours):
     for entry in hours:
         try:
             # Example entry: "Monday: 10:00\u202fAM\u2009\u2013\u20096:00\u202fPM"
+            entry = entry.translate(_WS_MAP)
             day, time_range = entry.split(": ", 1)
-            # Clean up time formatting using regex:
-            time_range_clean = re.sub(
-                r"(\d{1,2}:\d{2})\s*[^\w\d]*(AM|PM|am|pm)\s*[-–]\s*(\d{1,2}:\d{2})\s*[^\w\d]*(AM|PM|am|pm)",
-                r"\1 \2 - \3 \4", time_range)
+            # Clean up time formatting using the precompiled regex:
+            time_range_clean = _HOURS_RE.sub(r"\1 \2 - \3 \4", time_range)
             formatted_hours.append(f"{day}: {time_range_clean}")
         except Exception as e:
             logging.error(f"Error formatting hours entry '{entry}': {e}")
@@ -106,29 +167,61 @@ def get_social_media_links(website):
     Extract social media links (Facebook, Instagram, Twitter/X) by searching the raw HTML of the website.
     This method uses regex to find URL patterns directly in the HTML.
     """
+    # Cheap URL checks before spending an HTTP round-trip: binary assets
+    # can't contain links, and a website that IS a social page answers
+    # the question directly
+    parsed = urlparse(website)
+    if parsed.path.lower().endswith((".pdf", ".jpg", ".png")):
+        return "No social media links found"
+    host = parsed.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    for social_host, platform in (("facebook.com", "Facebook"), ("instagram.com", "Instagram"),
+                                  ("twitter.com", "Twitter/X"), ("x.com", "Twitter/X")):
+        if host == social_host:
+            return {platform: website}
+
     try:
-        response = requests.get(website, timeout=10, headers={"User-Agent": "Mozilla/5.0"})
+        # HEAD first: skip non-HTML responses and huge pages outright,
+        # before downloading anything
+        head = _SESSION.head(website, timeout=10, allow_redirects=True)
+        if head.status_code < 400:
+            if not head.headers.get("Content-Type", "text/html").startswith("text/html"):
+                return "No social media links found"
+            if int(head.headers.get("Content-Length") or 0) > 2_000_000:
+                return "No social media links found"
+
+        response = _SESSION.get(website, timeout=10, stream=True)
         if response.status_code != 200:
             logging.error(f"Failed to retrieve website {website} (status code: {response.status_code})")
             return "Failed to retrieve website"
 
-        html = response.text
-
-        # Use regex to extract URLs for each platform.
-        fb_links = re.findall(r'https?://(?:www\.)?facebook\.com/[^\s"\'<>]+', html, re.IGNORECASE)
-        insta_links = re.findall(r'https?://(?:www\.)?instagram\.com/[^\s"\'<>]+', html, re.IGNORECASE)
-        twitter_links = re.findall(r'https?://(?:www\.)?twitter\.com/[^\s"\'<>]+', html, re.IGNORECASE)
-        x_links = re.findall(r'https?://(?:www\.)?x\.com/[^\s"\'<>]+', html, re.IGNORECASE)
-
+        # Social links live in <head> or the footer markup, so a 256 KB
+        # window is plenty; capping here bounds both the download and the
+        # regex scan on multi-megabyte pages
+        # Decode with the declared charset or latin-1 — never response.text,
+        # whose charset detection scans the whole body. The social regex
+        # only matches ASCII, so latin-1 is always safe
+        raw = response.raw.read(262_144, decode_content=True)
+        html = raw.decode(response.encoding or "latin-1", errors="ignore")
+
+        # Cheap C-level substring check first: pages mentioning no social
+        # host at all skip the regex scan entirely
+        html_lower = html.lower()
+        if not any(host in html_lower for host in ("facebook.com", "instagram.com", "twitter.com", "x.com")):
+            return "No social media links found"
+
+        # Single pass over the HTML: keep the first link per platform and
+        # stop early once all three keys are filled
         social_links = {}
-        if fb_links:
-            social_links["Facebook"] = fb_links[0]
-        if insta_links:
-            social_links["Instagram"] = insta_links[0]
-        if twitter_links:
-            social_links["Twitter/X"] = twitter_links[0]
-        elif x_links:
-            social_links["Twitter/X"] = x_links[0]
+        try:
+            for match in _SOCIAL_RE.finditer(html, **_SOCIAL_SCAN_ARGS):
+                social_links.setdefault(_HOST_TO_KEY[match.group("host").lower()], match.group(0))
+                if len(social_links) == 3:
+                    break
+        except TimeoutError:
+            # Pathological page: keep whatever matched before the deadline
+            logging.warning(f"Social link scan timed out on {website}")
 
         return social_links if social_links else "No social media links found"
     except Exception as e:
@@ -174,25 +267,13 @@ def generate_summary(place_info):
     ]
 
     try:
-        # For newer OpenAI client
-        try:
-            client = openai.OpenAI(api_key=OPENAI_API_KEY)
-            response = client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=messages,
-                max_tokens=200,
-                temperature=0.7,
-            )
-            summary = response.choices[0].message.content.strip()
-        except (AttributeError, ImportError):
-            # Fallback for older OpenAI client
-            response = openai.ChatCompletion.create(
-                model="gpt-3.5-turbo",
-                messages=messages,
-                max_tokens=200,
-                temperature=0.7,
-            )
-            summary = response.choices[0].message.content.strip()
+        response = _chat_create(
+            model="gpt-3.5-turbo",
+            messages=messages,
+            max_tokens=200,
+            temperature=0.7,
+        )
+        summary = response.choices[0].message.content.strip()
 
         # Verify summary length and adjust if needed
         words = summary.split()
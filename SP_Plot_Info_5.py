@@ -3,12 +3,16 @@ import tkinter as tk
 from tkinter import ttk, scrolledtext
 import threading
 import json
-import requests
+import asyncio
+import aiohttp
+import copy
+import shelve
+import unicodedata
 import logging
 import re
 import openai
 from tkinter import messagebox
-from functools import lru_cache
+from urllib.parse import urlparse
 import time
 
 # Set up logging
@@ -18,6 +22,47 @@ logging.basicConfig(
     format="%(asctime)s - %(levelname)s - %(message)s"
 )
 
+# Pretty-print results with orjson (a C extension) when it's installed;
+# this runs on the Tk main thread, so the stdlib's pure-Python indenting
+# is a visible hitch on big payloads
+try:
+    import orjson
+
+    def _pretty_json(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _pretty_json(obj):
+        return json.dumps(obj, indent=4)
+
+# Google's hours strings use narrow/thin spaces and en dashes; one
+# C-level translate pass maps them to ASCII so the hours regex stays a
+# simple pattern with no catch-all character classes to backtrack over
+_WS_MAP = str.maketrans({"\u202f": " ", "\u2009": " ", "\u00a0": " ", "\u2013": "-", "\u2014": "-"})
+
+# Precompiled patterns, compiled once at import instead of per request
+_HOURS_RE = re.compile(
+    r"(\d{1,2}:\d{2})\s*(AM|PM|am|pm)\s*-\s*(\d{1,2}:\d{2})\s*(AM|PM|am|pm)")
+# Prefer RE2 for the pattern that runs on untrusted page HTML: it matches
+# in linear time, so adversarial input can't trigger pathological
+# backtracking. Next best is the PyPI `regex` module, whose timeout=
+# bounds a scan that does backtrack; the stdlib engine is the last
+# resort. The tiny, trusted hours pattern stays on the stdlib engine.
+try:
+    import re2 as _social_re
+    _SOCIAL_SCAN_ARGS = {}
+except ImportError:
+    try:
+        import regex as _social_re
+        _SOCIAL_SCAN_ARGS = {"timeout": 0.5}
+    except ImportError:
+        _social_re = re
+        _SOCIAL_SCAN_ARGS = {}
+
+# One alternation scans the HTML a single time for all platforms
+_SOCIAL_RE = _social_re.compile(
+    r'https?://(?:www\.)?(?P<host>facebook|instagram|twitter|x)\.com/[^\s"\'<>]+', re.IGNORECASE)
+_HOST_TO_KEY = {"facebook": "Facebook", "instagram": "Instagram", "twitter": "Twitter/X", "x": "Twitter/X"}
+
 
 class PlaceLookupApp:
     def __init__(self, root):
@@ -37,7 +82,7 @@ class PlaceLookupApp:
         # Initialize API clients
         if self.OPENAI_API_KEY:
             try:
-                self.openai_client = openai.OpenAI(api_key=self.OPENAI_API_KEY)
+                self.openai_client = openai.AsyncOpenAI(api_key=self.OPENAI_API_KEY)
             except (AttributeError, ImportError):
                 # Fall back to the older client interface
                 openai.api_key = self.OPENAI_API_KEY
@@ -45,12 +90,29 @@ class PlaceLookupApp:
         else:
             self.openai_client = None
 
-        # Session for making HTTP requests
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": "Mozilla/5.0"})
+        # Background asyncio loop: all network work runs on this thread so
+        # the Tk mainloop stays responsive and connection pools persist for
+        # the lifetime of the app
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+
+        # aiohttp session, created lazily on the background loop
+        self._http_session = None
+
+        # In-flight lookups keyed by normalized (place, location), so a
+        # batch with duplicate rows or a double-clicked Search button
+        # shares one pipeline instead of burning quota twice
+        self._inflight = {}
 
-        # Cache for recent searches
+        # Cache for recent searches, warmed from disk so a restart doesn't
+        # re-hit Google and OpenAI for places we already looked up
         self.place_cache = {}
+        self._load_disk_cache()
+
+        # Summaries keyed on the resolved place_id: "Starbucks, NYC" and
+        # "starbucks nyc" miss the query cache but resolve to the same
+        # place, so they reuse the same OpenAI summary
+        self.summary_cache = {}
 
         # Create UI
         self.create_ui()
@@ -117,6 +179,22 @@ class PlaceLookupApp:
         self.formatted_output = scrolledtext.ScrolledText(self.formatted_tab, wrap=tk.WORD)
         self.formatted_output.grid(row=0, column=0, padx=5, pady=5, sticky="nsew")
 
+        # Tab 3: Batch lookup (one "place, location" per line)
+        self.batch_tab = ttk.Frame(self.tab_control)
+        self.tab_control.add(self.batch_tab, text='Batch')
+        self.batch_tab.grid_columnconfigure(0, weight=1)
+        self.batch_tab.grid_rowconfigure(0, weight=1)
+        self.batch_tab.grid_rowconfigure(2, weight=2)
+
+        self.batch_input = scrolledtext.ScrolledText(self.batch_tab, wrap=tk.WORD, height=6)
+        self.batch_input.grid(row=0, column=0, padx=5, pady=5, sticky="nsew")
+
+        self.batch_button = ttk.Button(self.batch_tab, text="Run Batch", command=self.run_batch)
+        self.batch_button.grid(row=1, column=0, padx=5, pady=5)
+
+        self.batch_output = scrolledtext.ScrolledText(self.batch_tab, wrap=tk.WORD)
+        self.batch_output.grid(row=2, column=0, padx=5, pady=5, sticky="nsew")
+
         # Status bar
         self.status_var = tk.StringVar()
         self.status_var.set("Ready")
@@ -151,18 +229,17 @@ class PlaceLookupApp:
             messagebox.showerror("Input Error", "Please enter both place name and location.")
             return
 
-        # Check cache first
-        cache_key = f"{place_name}|{location}"
-        if cache_key in self.place_cache:
-            self.status_var.set("Loading from cache...")
-            self.progress_var.set(50)
-            self.root.update_idletasks()
-
-            # Short delay to show loading from cache
-            time.sleep(0.5)
-
-            # Update UI with cached results
-            self.update_ui_with_results(self.place_cache[cache_key])
+        # Check cache first (keys are normalized so "Cafe X" and "café x"
+        # hit the same entry)
+        cache_key = self._cache_key(place_name, location)
+        cached = self.place_cache.get(cache_key)
+        if cached is not None:
+            # Serve cache hits immediately; the status bar is feedback enough
+            self.status_var.set("Loaded from cache")
+
+            # Update UI with a copy so display code can never mutate the
+            # cached entry
+            self.update_ui_with_results(copy.deepcopy(cached))
             return
 
         # Disable search button and update status
@@ -171,22 +248,118 @@ class PlaceLookupApp:
         self.progress_var.set(0)
         self.root.update_idletasks()
 
-        # Run the search in a separate thread to prevent UI freeze
-        thread = threading.Thread(target=self.perform_search, args=(place_name, location))
-        thread.daemon = True
-        thread.start()
+        # Hand the search to the background loop to prevent UI freeze
+        asyncio.run_coroutine_threadsafe(self.perform_search(place_name, location), self._loop)
+
+    CACHE_FILE = "places_cache"
+    CACHE_MAX_AGE = 7 * 24 * 3600  # Entries older than a week are dropped
+
+    def _load_disk_cache(self):
+        """Warm the in-memory cache from disk, skipping expired entries."""
+        try:
+            with shelve.open(self.CACHE_FILE) as db:
+                now = time.time()
+                for key, (timestamp, details) in db.items():
+                    if now - timestamp < self.CACHE_MAX_AGE:
+                        self.place_cache[tuple(key.split("\x00", 1))] = details
+        except Exception as e:
+            logging.error(f"Could not load disk cache: {e}")
 
-    def perform_search(self, place_name, location):
+    def _persist_cache_entry(self, cache_key, place_details):
+        """Write one cache entry through to disk so it survives restarts."""
+        try:
+            with shelve.open(self.CACHE_FILE) as db:
+                db["\x00".join(cache_key)] = (time.time(), place_details)
+        except Exception as e:
+            logging.error(f"Could not persist cache entry: {e}")
+
+    @staticmethod
+    def _cache_key(place_name, location):
+        """Normalize a (place, location) pair into a stable cache key."""
+        def norm(s):
+            return unicodedata.normalize("NFKC", s).casefold().strip()
+
+        return norm(place_name), norm(location)
+
+    async def lookup_many(self, pairs):
+        """Look up many (place_name, location) pairs concurrently.
+
+        Inputs are deduplicated and at most 10 pipelines run at once so the
+        Google/OpenAI APIs aren't hammered. Returns a dict mapping each
+        unique pair to its place details (or the exception it raised).
+        """
+        sem = asyncio.Semaphore(10)
+
+        async def one(place_name, location):
+            async with sem:
+                return await self.get_place_details(place_name, location)
+
+        unique = list(dict.fromkeys(pairs))
+        results = await asyncio.gather(*(one(p, l) for p, l in unique), return_exceptions=True)
+        return dict(zip(unique, results))
+
+    def run_batch(self):
+        """Parse the batch input and dispatch all lookups to the loop."""
+        lines = [line.strip() for line in self.batch_input.get(1.0, tk.END).splitlines() if line.strip()]
+        pairs = []
+        for line in lines:
+            if "," not in line:
+                continue
+            place_name, location = line.split(",", 1)
+            pairs.append((place_name.strip(), location.strip()))
+
+        if not pairs:
+            messagebox.showerror("Input Error", "Enter one \"place, location\" per line.")
+            return
+
+        self.batch_button.config(state=tk.DISABLED)
+        self.status_var.set(f"Running batch of {len(pairs)} lookups...")
+        future = asyncio.run_coroutine_threadsafe(self.lookup_many(pairs), self._loop)
+        future.add_done_callback(lambda f: self.root.after(0, self.show_batch_results, f))
+
+    def show_batch_results(self, future):
+        """Render the batch results in the batch tab (runs on the Tk thread)."""
+        self.batch_button.config(state=tk.NORMAL)
+        try:
+            results = future.result()
+        except Exception as e:
+            self.status_var.set(f"Batch failed: {e}")
+            messagebox.showerror("Error", f"Batch lookup failed: {e}")
+            return
+
+        self.batch_output.delete(1.0, tk.END)
+        for (place_name, location), details in results.items():
+            self.batch_output.insert(tk.END, f"=== {place_name}, {location} ===\n")
+            if isinstance(details, Exception):
+                self.batch_output.insert(tk.END, f"Error: {details}\n\n")
+            elif details:
+                self.batch_output.insert(tk.END, self.format_place_details(details) + "\n")
+            else:
+                self.batch_output.insert(tk.END, "Place not found.\n\n")
+        self.status_var.set(f"Batch complete: {len(results)} unique lookups")
+        self.progress_var.set(100)
+
+    async def _get_session(self):
+        """Return the shared aiohttp session, creating it on first use."""
+        if self._http_session is None:
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=50),
+                headers={"User-Agent": "Mozilla/5.0"}
+            )
+        return self._http_session
+
+    async def perform_search(self, place_name, location):
         try:
             self.status_var.set(f"Looking up information for {place_name} in {location}...")
             self.update_progress(10)
 
-            place_details = self.get_place_details(place_name, location)
+            place_details = await self.get_place_details(place_name, location, ui_stream=True)
 
             if place_details:
                 # Cache the results
-                cache_key = f"{place_name}|{location}"
-                self.place_cache[cache_key] = place_details
+                cache_key = self._cache_key(place_name, location)
+                self.place_cache[cache_key] = copy.deepcopy(place_details)
+                self._persist_cache_entry(cache_key, place_details)
 
                 # Update the UI with the results
                 self.root.after(0, self.update_ui_with_results, place_details)
@@ -203,13 +376,42 @@ class PlaceLookupApp:
         self.root.after(0, lambda: self.search_button.config(state=tk.NORMAL))
 
     def update_progress(self, value):
-        """Update progress bar value"""
-        self.root.after(0, lambda: self.progress_var.set(value))
-        self.root.update_idletasks()
+        """Update progress bar value.
+
+        Setting the variable via after() is all that's needed: Tk repaints
+        on its own schedule, so rapid progress steps coalesce instead of
+        each forcing a full redraw with update_idletasks().
+        """
+        self.root.after(0, self.progress_var.set, value)
+
+    def show_partial_results(self, partial_details):
+        """Render everything except the summary as soon as details arrive.
+
+        The summary streams in below this, so the user sees place data at
+        first-token time instead of waiting for the full completion.
+        """
+        self.json_output.delete(1.0, tk.END)
+        self.json_output.insert(tk.END, _pretty_json(partial_details))
+
+        self.formatted_output.delete(1.0, tk.END)
+        self.formatted_output.insert(tk.END, self.format_place_details(partial_details, include_summary=False))
+        self.formatted_output.insert(tk.END, "=" * 50 + "\n\nSUMMARY:\n\n")
+
+        self.status_var.set("Streaming summary...")
+        self.tab_control.select(1)
+
+    def _append_summary_delta(self, text):
+        """Append one streamed summary token to the formatted view."""
+        self.formatted_output.insert(tk.END, text)
+        self.formatted_output.see(tk.END)
 
     def update_ui_with_results(self, place_details):
+        # Replace any partial/streamed render from this search
+        self.json_output.delete(1.0, tk.END)
+        self.formatted_output.delete(1.0, tk.END)
+
         # Update JSON tab
-        json_str = json.dumps(place_details, indent=4)
+        json_str = _pretty_json(place_details)
         self.json_output.insert(tk.END, json_str)
 
         # Update Formatted tab (now includes summary)
@@ -223,7 +425,7 @@ class PlaceLookupApp:
         # Switch to formatted tab
         self.tab_control.select(1)  # Index 1 is the formatted tab
 
-    def format_place_details(self, place_details):
+    def format_place_details(self, place_details, include_summary=True):
         """Format place details for human-readable display"""
         formatted = f"Name: {place_details.get('name', 'N/A')}\n\n"
 
@@ -254,17 +456,33 @@ class PlaceLookupApp:
             formatted += f"Social Media: {social_media}\n\n"
 
         # Add summary section
-        summary = place_details.get("summary", "No summary available")
-        formatted += "=" * 50 + "\n\n"
-        formatted += "SUMMARY:\n\n"
-        formatted += summary + "\n\n"
-        formatted += "=" * 50 + "\n"
+        if include_summary:
+            summary = place_details.get("summary", "No summary available")
+            formatted += "=" * 50 + "\n\n"
+            formatted += "SUMMARY:\n\n"
+            formatted += summary + "\n\n"
+            formatted += "=" * 50 + "\n"
 
         return formatted
 
-    @lru_cache(maxsize=32)
-    def get_place_details(self, place_name, location):
-        """Search for a place using Google Places Text Search API with caching."""
+    async def get_place_details(self, place_name, location, ui_stream=False):
+        """Search for a place, coalescing concurrent identical lookups.
+
+        All coroutines run on the single background loop, so the plain
+        dict bookkeeping here is race-free. With ui_stream, place data is
+        rendered as soon as it's known and the summary streams into the
+        formatted view token by token.
+        """
+        key = self._cache_key(place_name, location)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_place_details(place_name, location, ui_stream))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await task
+
+    async def _fetch_place_details(self, place_name, location, ui_stream=False):
+        """Search for a place using Google Places Text Search API."""
         endpoint = "https://maps.googleapis.com/maps/api/place/textsearch/json"
         query = f"{place_name}, {location}"
         params = {"query": query, "key": self.GOOGLE_API_KEY}
@@ -272,21 +490,22 @@ class PlaceLookupApp:
         self.status_var.set(f"Searching for {place_name} in {location}...")
         self.update_progress(20)
 
-        response = self.session.get(endpoint, params=params)
-        if response.status_code == 200:
-            result = response.json()
-            if result.get("status") == "OK" and result.get("results"):
-                place_id = result["results"][0]["place_id"]
-                self.update_progress(30)
-                return self.get_place_info(place_id)
-            else:
-                logging.warning(f"No results found for {query}. API Response: {result}")
+        session = await self._get_session()
+        async with session.get(endpoint, params=params) as response:
+            if response.status != 200:
+                logging.error(f"API request failed with status code {response.status}")
                 return None
+            result = await response.json()
+
+        if result.get("status") == "OK" and result.get("results"):
+            place_id = result["results"][0]["place_id"]
+            self.update_progress(30)
+            return await self.get_place_info(place_id, ui_stream=ui_stream)
         else:
-            logging.error(f"API request failed with status code {response.status_code}")
+            logging.warning(f"No results found for {query}. API Response: {result}")
             return None
 
-    def get_place_info(self, place_id):
+    async def get_place_info(self, place_id, ui_stream=False):
         """Retrieve detailed information about a place using its Place ID."""
         details_endpoint = "https://maps.googleapis.com/maps/api/place/details/json"
         details_params = {
@@ -298,47 +517,66 @@ class PlaceLookupApp:
         self.status_var.set("Retrieving place details...")
         self.update_progress(40)
 
-        details_response = self.session.get(details_endpoint, params=details_params)
-        if details_response.status_code == 200:
-            place_details = details_response.json()
-            if place_details.get("status") == "OK":
-                details = place_details.get("result")
-                website = details.get("website", "N/A")
-
-                # Get place type
-                place_types = details.get("types", [])
-                place_type = place_types[0].replace('_', ' ').title() if place_types else "N/A"
-
-                self.update_progress(50)
-
-                # Construct our place_info dictionary
-                place_info = {
-                    "name": details.get("name", "N/A"),
-                    "type": place_type,
-                    "address": details.get("formatted_address", "N/A"),
-                    "website": website,
-                    "hours": self.format_opening_hours(details.get("opening_hours", {}).get("weekday_text", [])),
-                }
-
-                # Get social media links only if website is available
-                if website != "N/A":
-                    place_info["social_media"] = self.get_social_media_links(website)
-                else:
-                    place_info["social_media"] = "No website available"
-
-                self.update_progress(80)
-
-                # Generate a 100-word summary and add it to our dictionary
-                place_info["summary"] = self.generate_summary(place_info)
+        session = await self._get_session()
+        async with session.get(details_endpoint, params=details_params) as details_response:
+            if details_response.status != 200:
+                logging.error(f"API request failed with status code {details_response.status}")
+                return None
+            place_details = await details_response.json()
+
+        if place_details.get("status") == "OK":
+            details = place_details.get("result")
+            website = details.get("website", "N/A")
+
+            # Get place type
+            place_types = details.get("types", [])
+            place_type = place_types[0].replace('_', ' ').title() if place_types else "N/A"
+
+            self.update_progress(50)
+
+            # Construct our place_info dictionary
+            place_info = {
+                "name": details.get("name", "N/A"),
+                "type": place_type,
+                "address": details.get("formatted_address", "N/A"),
+                "website": website,
+                "hours": self.format_opening_hours(details.get("opening_hours", {}).get("weekday_text", [])),
+            }
+
+            if ui_stream:
+                # Show the place data now; the summary streams in below it
+                self.root.after(0, self.show_partial_results, dict(place_info))
+            on_delta = self._append_summary_delta if ui_stream else None
+
+            async def summary_for_place():
+                # The summary depends only on the resolved place, so cache
+                # it under the authoritative place_id; query-string
+                # variants of the same place skip the OpenAI call entirely
+                cached = self.summary_cache.get(place_id)
+                if cached is not None:
+                    return cached
+                summary = await self.generate_summary(place_info, on_delta=on_delta)
+                if not summary.startswith("Error"):
+                    self.summary_cache[place_id] = summary
+                return summary
+
+            # The social scrape and the 100-word summary are independent,
+            # so run them concurrently when there's a website; the summary
+            # prompt simply omits the social links
+            if website != "N/A":
+                place_info["social_media"], place_info["summary"] = await asyncio.gather(
+                    self.get_social_media_links(website),
+                    summary_for_place()
+                )
+            else:
+                place_info["social_media"] = "No website available"
+                place_info["summary"] = await summary_for_place()
 
-                self.update_progress(95)
+            self.update_progress(95)
 
-                return place_info
-            else:
-                logging.warning(f"No detailed info found for Place ID {place_id}. API Response: {place_details}")
-                return None
+            return place_info
         else:
-            logging.error(f"API request failed with status code {details_response.status_code}")
+            logging.warning(f"No detailed info found for Place ID {place_id}. API Response: {place_details}")
             return None
 
     def format_opening_hours(self, hours):
@@ -353,70 +591,101 @@ class PlaceLookupApp:
         for entry in hours:
             try:
                 # Example entry: "Monday: 10:00\u202fAM\u2009\u2013\u20096:00\u202fPM"
+                entry = entry.translate(_WS_MAP)
                 day, time_range = entry.split(": ", 1)
-                # Clean up time formatting using regex:
-                time_range_clean = re.sub(
-                    r"(\d{1,2}:\d{2})\s*[^\w\d]*(AM|PM|am|pm)\s*[-–]\s*(\d{1,2}:\d{2})\s*[^\w\d]*(AM|PM|am|pm)",
-                    r"\1 \2 - \3 \4", time_range)
+                # Clean up time formatting using the precompiled regex:
+                time_range_clean = _HOURS_RE.sub(r"\1 \2 - \3 \4", time_range)
                 formatted_hours.append(f"{day}: {time_range_clean}")
             except Exception as e:
                 logging.error(f"Error formatting hours entry '{entry}': {e}")
                 formatted_hours.append(entry)
         return formatted_hours
 
-    def get_social_media_links(self, website):
+    async def get_social_media_links(self, website):
         """
         Extract social media links (Facebook, Instagram, Twitter/X) by searching the raw HTML of the website.
         This method uses regex to find URL patterns directly in the HTML.
         """
+        # Cheap URL checks before spending an HTTP round-trip: binary
+        # assets can't contain links, and a website that IS a social page
+        # answers the question directly
+        parsed = urlparse(website)
+        if parsed.path.lower().endswith((".pdf", ".jpg", ".png")):
+            return "No social media links found"
+        host = parsed.netloc.lower()
+        if host.startswith("www."):
+            host = host[4:]
+        for social_host, platform in (("facebook.com", "Facebook"), ("instagram.com", "Instagram"),
+                                      ("twitter.com", "Twitter/X"), ("x.com", "Twitter/X")):
+            if host == social_host:
+                return {platform: website}
+
         try:
             self.status_var.set(f"Retrieving website content from {website}...")
             self.update_progress(60)
 
             # Use a timeout to avoid hanging on slow websites
-            response = self.session.get(website, timeout=8)
-            if response.status_code != 200:
-                logging.error(f"Failed to retrieve website {website} (status code: {response.status_code})")
-                return "Failed to retrieve website"
-
-            html = response.text
+            session = await self._get_session()
+
+            # HEAD first: skip non-HTML responses and huge pages outright,
+            # before downloading anything
+            async with session.head(website, timeout=aiohttp.ClientTimeout(total=8),
+                                    allow_redirects=True) as head:
+                if head.status < 400:
+                    if not head.headers.get("Content-Type", "text/html").startswith("text/html"):
+                        return "No social media links found"
+                    if int(head.headers.get("Content-Length") or 0) > 2_000_000:
+                        return "No social media links found"
+
+            async with session.get(website, timeout=aiohttp.ClientTimeout(total=8)) as response:
+                if response.status != 200:
+                    logging.error(f"Failed to retrieve website {website} (status code: {response.status})")
+                    return "Failed to retrieve website"
+
+                # Social links live in <head> or the footer markup, so a
+                # 256 KB window is plenty; capping here bounds both the
+                # download and the regex scan on multi-megabyte pages
+                # Decode with the declared charset or latin-1 — never
+                # response.text(), whose charset detection scans the whole
+                # body. The social regex only matches ASCII, so latin-1 is
+                # always safe
+                raw = await response.content.read(262_144)
+                html = raw.decode(response.charset or "latin-1", errors="ignore")
 
             self.update_progress(70)
 
-            # Precompile regex patterns for better performance
-            fb_pattern = re.compile(r'https?://(?:www\.)?facebook\.com/[^\s"\'<>]+', re.IGNORECASE)
-            insta_pattern = re.compile(r'https?://(?:www\.)?instagram\.com/[^\s"\'<>]+', re.IGNORECASE)
-            twitter_pattern = re.compile(r'https?://(?:www\.)?twitter\.com/[^\s"\'<>]+', re.IGNORECASE)
-            x_pattern = re.compile(r'https?://(?:www\.)?x\.com/[^\s"\'<>]+', re.IGNORECASE)
-
-            # Find all matches
-            fb_links = fb_pattern.findall(html)
-            insta_links = insta_pattern.findall(html)
-            twitter_links = twitter_pattern.findall(html)
-            x_links = x_pattern.findall(html)
+            # Cheap C-level substring check first: pages mentioning no
+            # social host at all skip the regex scan entirely
+            html_lower = html.lower()
+            if not any(host in html_lower for host in ("facebook.com", "instagram.com", "twitter.com", "x.com")):
+                return "No social media links found"
 
+            # Single pass over the HTML: keep the first link per platform
+            # and stop early once all three keys are filled
             social_links = {}
-            if fb_links:
-                social_links["Facebook"] = fb_links[0]
-            if insta_links:
-                social_links["Instagram"] = insta_links[0]
-            if twitter_links:
-                social_links["Twitter/X"] = twitter_links[0]
-            elif x_links:
-                social_links["Twitter/X"] = x_links[0]
+            try:
+                for match in _SOCIAL_RE.finditer(html, **_SOCIAL_SCAN_ARGS):
+                    social_links.setdefault(_HOST_TO_KEY[match.group("host").lower()], match.group(0))
+                    if len(social_links) == 3:
+                        break
+            except TimeoutError:
+                # Pathological page: keep whatever matched before the
+                # deadline
+                logging.warning(f"Social link scan timed out on {website}")
 
             return social_links if social_links else "No social media links found"
-        except requests.Timeout:
+        except asyncio.TimeoutError:
             logging.error(f"Timeout retrieving website {website}")
             return "Timeout retrieving website content"
         except Exception as e:
             logging.error(f"Error retrieving social media links from {website}: {e}")
             return f"Error retrieving social media links: {e}"
 
-    def generate_summary(self, place_info):
+    async def generate_summary(self, place_info, on_delta=None):
         """
         Generate a precise 100-word summary for the point of interest using OpenAI's API.
         The summary is based on the place's name, address, website, hours, and social media links.
+        on_delta, when given, receives each streamed token on the Tk thread.
         """
         if not self.OPENAI_API_KEY:
             logging.error("OpenAI API key not set.")
@@ -458,16 +727,28 @@ class PlaceLookupApp:
             self.update_progress(90)
             # Use pre-initialized client if available
             if self.openai_client:
-                response = self.openai_client.chat.completions.create(
+                # Stream the completion so tokens can be shown as they
+                # arrive; perceived latency drops to first-token time
+                response = await self.openai_client.chat.completions.create(
                     model="gpt-3.5-turbo",
                     messages=messages,
                     max_tokens=200,
                     temperature=0.7,
+                    stream=True,
                 )
-                summary = response.choices[0].message.content.strip()
+                parts = []
+                async for chunk in response:
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        parts.append(delta)
+                        if on_delta is not None:
+                            self.root.after(0, on_delta, delta)
+                summary = "".join(parts).strip()
             else:
-                # Fallback for older OpenAI client
-                response = openai.ChatCompletion.create(
+                # Fallback for older OpenAI client; run the blocking call in
+                # a worker thread so it doesn't stall the event loop
+                response = await asyncio.to_thread(
+                    openai.ChatCompletion.create,
                     model="gpt-3.5-turbo",
                     messages=messages,
                     max_tokens=200,
@@ -1,25 +1,33 @@
+import functools
 import sys
 import crewai
 from crewai import OpenAICompletion  # This is an example; adjust if needed
 
 
-def summarize_text_with_crewai(text, min_sentences=3, max_sentences=7):
+@functools.lru_cache(maxsize=4)
+def _get_agent(api_key, model):
     """
-    Creates a CrewAI agent with required fields and uses it to summarize the provided text.
-    This version uses an LLM instance and then calls the agent as a callable.
+    Build (once per key/model pair) the LLM instance and summarizer agent.
+    Repeat calls reuse the agent and its underlying HTTP session instead
+    of paying the construction cost per summary.
     """
-    # Create an LLM instance (adjust parameters if needed)
-    llm = OpenAICompletion(api_key="YOUR_API_KEY", model="gpt-3.5-turbo")
-
-    # Create an agent with the required fields and provide the LLM instance.
-    agent = crewai.Agent(
-        api_key="YOUR_API_KEY",  # Replace with your actual API key
+    llm = OpenAICompletion(api_key=api_key, model=model)
+    return crewai.Agent(
+        api_key=api_key,
         role="summarizer",
         goal="Summarize the provided text into a concise summary of 3 to 7 sentences.",
         backstory="I am an AI summarization agent built to condense long texts into a short, informative summary.",
         llm=llm
     )
 
+
+def summarize_text_with_crewai(text, min_sentences=3, max_sentences=7):
+    """
+    Uses a cached CrewAI summarizer agent to summarize the provided text.
+    This version uses an LLM instance and then calls the agent as a callable.
+    """
+    agent = _get_agent("YOUR_API_KEY", "gpt-3.5-turbo")  # Replace with your actual API key
+
     # Use the agent as a callable. (Adjust the parameters according to CrewAI's API.)
     response = agent("summarize", text=text, min_sentences=min_sentences, max_sentences=max_sentences)
 
@@ -32,20 +40,12 @@ def summarize_text_with_crewai(text, min_sentences=3, max_sentences=7):
 
 def main():
     print("Please enter your text (up to 99,999 characters).")
-    print("When finished, press Enter on an empty line:")
-
-    # Read multi-line input until an empty line is entered.
-    lines = []
-    while True:
-        line = input()
-        if line.strip() == "":
-            break
-        lines.append(line)
-    text = "\n".join(lines)
-
-    # Truncate if text exceeds 99,999 characters.
-    if len(text) > 99999:
-        text = text[:99999]
+    print("When finished, press Ctrl-D (Ctrl-Z then Enter on Windows):")
+
+    # One read call grabs the whole paste and caps the length at the
+    # source — no per-line input() round-trips, no join, and no oversized
+    # string to truncate afterwards.
+    text = sys.stdin.read(99999)
 
     try:
         summary = summarize_text_with_crewai(text, min_sentences=3, max_sentences=7)
@@ -2,6 +2,8 @@ import pygame
 import random
 import time
 import os
+import heapq
+from collections import deque
 
 # Initialize pygame
 pygame.init()
@@ -9,6 +11,8 @@ pygame.init()
 # Screen dimensions
 WIDTH, HEIGHT = 600, 400
 CELL_SIZE = 20
+COLS = WIDTH // CELL_SIZE
+ROWS = HEIGHT // CELL_SIZE
 
 # Colors
 WHITE = (255, 255, 255)
@@ -17,69 +21,145 @@ RED = (255, 0, 0)
 BLACK = (0, 0, 0)
 PURPLE = (128, 0, 128)
 
-# Directions
+# Directions (in cells, used for grid math)
 UP = (0, -1)
 DOWN = (0, 1)
 LEFT = (-1, 0)
 RIGHT = (1, 0)
 
+# The same directions pre-scaled to pixels, so per-tick position math
+# skips the CELL_SIZE multiplies
+UP_PX = (0, -CELL_SIZE)
+DOWN_PX = (0, CELL_SIZE)
+LEFT_PX = (-CELL_SIZE, 0)
+RIGHT_PX = (CELL_SIZE, 0)
+MOVES_PX = (UP_PX, DOWN_PX, LEFT_PX, RIGHT_PX)
+
 # Set up display
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Self-Playing Snake Game with Obstacles")
 
+# Pre-filled cell surfaces: blitting one of these hits SDL's fast
+# rect-copy path instead of a per-pixel draw.rect fill
+GREEN_CELL = pygame.Surface((CELL_SIZE, CELL_SIZE))
+GREEN_CELL.fill(GREEN)
+RED_CELL = pygame.Surface((CELL_SIZE, CELL_SIZE))
+RED_CELL.fill(RED)
+PURPLE_CELL = pygame.Surface((CELL_SIZE, CELL_SIZE))
+PURPLE_CELL.fill(PURPLE)
+BLACK_CELL = pygame.Surface((CELL_SIZE, CELL_SIZE))
+BLACK_CELL.fill(BLACK)
+
 clock = pygame.time.Clock()
 
 # Font for score display
 font = pygame.font.Font(None, 36)
 
-HIGH_SCORE_FILE = "highscore.txt"
+# 4-byte little-endian binary; .dat so an old text highscore.txt is
+# never misread as raw bytes
+HIGH_SCORE_FILE = "highscore.dat"
 
 
 def load_high_score():
     """ Load the high score from a file or return 0 if file doesn't exist. """
     if os.path.exists(HIGH_SCORE_FILE):
-        with open(HIGH_SCORE_FILE, "r") as file:
-            return int(file.read().strip() or 0)
+        with open(HIGH_SCORE_FILE, "rb") as file:
+            return int.from_bytes(file.read(4) or b"\x00\x00\x00\x00", "little")
     return 0
 
 
 def save_high_score(score):
-    """ Save the high score to a file immediately when it's updated. """
-    with open(HIGH_SCORE_FILE, "w") as file:
-        file.write(str(score))
+    """ Save the high score as a fixed-width binary int. """
+    with open(HIGH_SCORE_FILE, "wb") as file:
+        file.write(score.to_bytes(4, "little"))
 
 
-def random_position(exclude):
-    """ Generate a random position avoiding the given exclude list. """
-    while True:
-        pos = (random.randint(0, (WIDTH // CELL_SIZE) - 1) * CELL_SIZE,
-               random.randint(0, (HEIGHT // CELL_SIZE) - 1) * CELL_SIZE)
-        if pos not in exclude:
-            return pos
+def random_position(free_cells):
+    """ Pick a uniformly random cell from the free-cell set.
 
+    No rejection sampling: as the board fills up, retry loops over random
+    coords would spin longer and longer, while this stays one draw.
+    """
+    return random.choice(tuple(free_cells))
 
-def get_valid_directions(snake, obstacles):
+
+def get_valid_directions(head, snake_set, obstacle_set):
     """ Returns a list of valid directions the snake can move without hitting itself or an obstacle. """
-    head_x, head_y = snake[0]
+    head_x, head_y = head
     possible_moves = []
 
-    for move in [UP, DOWN, LEFT, RIGHT]:
-        new_pos = (head_x + move[0] * CELL_SIZE, head_y + move[1] * CELL_SIZE)
+    for move in MOVES_PX:
+        new_pos = (head_x + move[0], head_y + move[1])
         if (0 <= new_pos[0] < WIDTH and 0 <= new_pos[1] < HEIGHT and
-                new_pos not in snake and new_pos not in obstacles):
+                new_pos not in snake_set and new_pos not in obstacle_set):
             possible_moves.append(move)
 
     return possible_moves
 
 
-def get_direction_to_food(snake, food, obstacles):
+def build_blocked(snake_set, obstacle_set):
+    """ Flatten the occupied cells into a row-major bytearray wallmap. """
+    blocked = bytearray(COLS * ROWS)
+    for x, y in snake_set:
+        blocked[(y // CELL_SIZE) * COLS + x // CELL_SIZE] = 1
+    for x, y in obstacle_set:
+        blocked[(y // CELL_SIZE) * COLS + x // CELL_SIZE] = 1
+    return blocked
+
+
+def astar(start, goal, blocked):
+    """ A* from start to goal (pixel positions) over the cell grid.
+
+    Manhattan distance is the heuristic. Returns a deque of pixel-delta
+    directions to follow, or None when the fruit is unreachable.
+    """
+    sx, sy = start[0] // CELL_SIZE, start[1] // CELL_SIZE
+    gx, gy = goal[0] // CELL_SIZE, goal[1] // CELL_SIZE
+    start_i = sy * COLS + sx
+    goal_i = gy * COLS + gx
+
+    open_q = [(abs(gx - sx) + abs(gy - sy), 0, start_i)]
+    came_from = {start_i: (-1, None)}
+    g_score = {start_i: 0}
+    closed = bytearray(COLS * ROWS)
+
+    while open_q:
+        _, g, idx = heapq.heappop(open_q)
+        if idx == goal_i:
+            # Walk back to the start collecting the moves taken
+            path = deque()
+            while idx != start_i:
+                idx, move = came_from[idx]
+                path.appendleft(move)
+            return path
+        if closed[idx]:
+            continue
+        closed[idx] = 1
+        x, y = idx % COLS, idx // COLS
+        for move, move_px in zip((UP, DOWN, LEFT, RIGHT), MOVES_PX):
+            nx, ny = x + move[0], y + move[1]
+            if not (0 <= nx < COLS and 0 <= ny < ROWS):
+                continue
+            n_idx = ny * COLS + nx
+            if closed[n_idx] or blocked[n_idx]:
+                continue
+            new_g = g + 1
+            if new_g < g_score.get(n_idx, 1 << 30):
+                g_score[n_idx] = new_g
+                came_from[n_idx] = (idx, move_px)
+                heapq.heappush(open_q, (new_g + abs(gx - nx) + abs(gy - ny), new_g, n_idx))
+
+    return None  # Fruit is walled off for now
+
+
+def get_direction_to_food(head, food, snake_set, obstacle_set):
     """ AI determines the best move to reach food while avoiding obstacles. """
-    valid_moves = get_valid_directions(snake, obstacles)
+    valid_moves = get_valid_directions(head, snake_set, obstacle_set)
 
     if not valid_moves:
-        return RIGHT  # If stuck, default to right
+        return RIGHT_PX  # If stuck, default to right
 
-    head_x, head_y = snake[0]
+    head_x, head_y = head
     food_x, food_y = food
 
     # Prioritize moving toward food while avoiding obstacles
@@ -87,8 +167,8 @@ def get_direction_to_food(snake, food, obstacles):
     min_distance = float('inf')
 
     for move in valid_moves:
-        new_x = head_x + move[0] * CELL_SIZE
-        new_y = head_y + move[1] * CELL_SIZE
+        new_x = head_x + move[0]
+        new_y = head_y + move[1]
         distance = abs(food_x - new_x) + abs(food_y - new_y)
 
         if distance < min_distance:
@@ -98,84 +178,155 @@ def get_direction_to_food(snake, food, obstacles):
     return best_move if best_move else random.choice(valid_moves)
 
 
+# Rendered score text keyed on the value, so repeat draws skip SDL_ttf
+# glyph rasterization entirely
+_score_cache = {}
+_high_cache = {}
+
+
 def draw_score(score, high_score):
     """ Display the current score and high score on the screen. """
-    score_text = font.render(f"Score: {score}", True, WHITE)
-    high_score_text = font.render(f"High Score: {high_score}", True, WHITE)
+    score_text = _score_cache.get(score)
+    if score_text is None:
+        score_text = _score_cache.setdefault(score, font.render(f"Score: {score}", True, WHITE))
+    high_score_text = _high_cache.get(high_score)
+    if high_score_text is None:
+        high_score_text = _high_cache.setdefault(
+            high_score, font.render(f"High Score: {high_score}", True, WHITE))
 
     screen.blit(score_text, (10, 10))  # Score at top-left
     screen.blit(high_score_text, (WIDTH - 190, 10))  # High Score positioned left
 
 
 def main():
-    snake = [(WIDTH // 2, HEIGHT // 2)]
-    direction = RIGHT
-    fruit = random_position(snake)
-    obstacles = []  # List to store obstacles
+    snake = deque([(WIDTH // 2, HEIGHT // 2)])  # appendleft/pop are O(1)
+    snake_set = {snake[0]}  # Mirrors the body for O(1) collision checks
+    direction = RIGHT_PX
+
+    # Every unoccupied cell, kept in sync as things move so spawning
+    # never has to search for a free spot
+    free_cells = {(x * CELL_SIZE, y * CELL_SIZE) for x in range(COLS) for y in range(ROWS)}
+    free_cells.discard(snake[0])
+
+    fruit = random_position(free_cells)
+    free_cells.discard(fruit)
+    obstacles = []  # List to store obstacles (drawing order)
+    obstacle_set = set()  # Mirrors obstacles for O(1) collision checks
+    path = deque()  # Cached A* plan toward the fruit, one direction per tick
     last_obstacle_time = time.time()
     score = 0  # Initialize score
     high_score = load_high_score()
+    saved_high = high_score  # What's on disk; only rewrite when beaten
+
+    # Score text sits in fixed bands along the top; repaint them whenever
+    # a value changes or a cell repaint runs underneath them
+    score_rect = pygame.Rect(10, 10, 220, 36)
+    high_rect = pygame.Rect(WIDTH - 190, 10, 180, 36)
+    prev_score = score
+    prev_high = high_score
+
+    # One full paint up front; after this, each frame only repaints the
+    # handful of cells that actually changed
+    screen.fill(BLACK)
+    # One C call paints the whole body instead of a blit per segment
+    screen.blits([(GREEN_CELL, segment) for segment in snake])
+    screen.blit(RED_CELL, fruit)
+    draw_score(score, high_score)
+    pygame.display.flip()
 
     running = True
     while running:
-        screen.fill(BLACK)
-
-        # AI controls the snake direction
-        new_direction = get_direction_to_food(snake, fruit, obstacles)
-        if new_direction:
-            direction = new_direction
+        dirty = []
+
+        # AI controls the snake: follow the cached A* plan, re-planning
+        # only when it ran out or the board changed underneath it; fall
+        # back to the one-step greedy chooser when the fruit is walled off
+        if not path:
+            path = astar(snake[0], fruit, build_blocked(snake_set, obstacle_set)) or deque()
+        if path:
+            direction = path.popleft()
+            head_x, head_y = snake[0]
+            next_pos = (head_x + direction[0], head_y + direction[1])
+            if next_pos in snake_set or next_pos in obstacle_set:
+                # The planned step got blocked; dodge greedily this tick
+                # and re-plan on the next one
+                path.clear()
+                new_direction = get_direction_to_food(snake[0], fruit, snake_set, obstacle_set)
+                if new_direction:
+                    direction = new_direction
+        else:
+            new_direction = get_direction_to_food(snake[0], fruit, snake_set, obstacle_set)
+            if new_direction:
+                direction = new_direction
 
         # Move snake
         head_x, head_y = snake[0]
-        new_head = (head_x + direction[0] * CELL_SIZE, head_y + direction[1] * CELL_SIZE)
+        new_head = (head_x + direction[0], head_y + direction[1])
 
         # Check for collisions with walls or itself
-        if (new_head in snake or
+        if (new_head in snake_set or
                 new_head[0] < 0 or new_head[0] >= WIDTH or
                 new_head[1] < 0 or new_head[1] >= HEIGHT):
             running = False
             continue
 
         # Check if snake collides with an obstacle
-        if new_head in obstacles:
+        if new_head in obstacle_set:
             score = max(0, score - 3)  # Subtract 3 points, but keep score >= 0
             obstacles.remove(new_head)  # Remove the obstacle the snake hit
+            obstacle_set.discard(new_head)
 
-        # Move the snake forward
-        snake.insert(0, new_head)
+        # Move the snake forward (the head cell covers any obstacle that
+        # was just hit)
+        snake.appendleft(new_head)
+        snake_set.add(new_head)
+        free_cells.discard(new_head)
+        dirty.append(screen.blit(GREEN_CELL, new_head))
 
         # Check if snake eats the fruit
         if new_head == fruit:
-            fruit = random_position(snake + obstacles)  # New food, avoid obstacles
+            fruit = random_position(free_cells)  # New food on a free cell
+            free_cells.discard(fruit)
+            path.clear()  # New goal, re-plan
+            dirty.append(screen.blit(RED_CELL, fruit))
             score += 5  # Increase score
-            if score > high_score:  # If new high score, update it and save immediately
+            if score > high_score:  # If new high score, update the display copy
                 high_score = score
-                save_high_score(high_score)
         else:
-            snake.pop()  # Remove the tail
+            tail = snake.pop()  # Remove the tail
+            snake_set.discard(tail)
+            free_cells.add(tail)
+            dirty.append(screen.blit(BLACK_CELL, tail))
 
         # Add obstacles every 2 seconds
         if time.time() - last_obstacle_time > 2:
-            obstacles.append(random_position(snake + obstacles + [fruit]))
+            new_obstacle = random_position(free_cells)
+            free_cells.discard(new_obstacle)
+            obstacles.append(new_obstacle)
+            obstacle_set.add(new_obstacle)
+            path.clear()  # The new obstacle may cut the planned route
+            dirty.append(screen.blit(PURPLE_CELL, new_obstacle))
             last_obstacle_time = time.time()
 
-        # Draw snake
-        for segment in snake:
-            pygame.draw.rect(screen, GREEN, (segment[0], segment[1], CELL_SIZE, CELL_SIZE))
-
-        # Draw fruit
-        pygame.draw.rect(screen, RED, (fruit[0], fruit[1], CELL_SIZE, CELL_SIZE))
-
-        # Draw obstacles
-        for obstacle in obstacles:
-            pygame.draw.rect(screen, PURPLE, (obstacle[0], obstacle[1], CELL_SIZE, CELL_SIZE))
-
-        # Display score and high score
-        draw_score(score, high_score)
-
-        pygame.display.flip()
+        # Display score and high score, but only repaint when needed
+        if (score != prev_score or high_score != prev_high
+                or any(r.colliderect(score_rect) or r.colliderect(high_rect) for r in dirty)):
+            pygame.draw.rect(screen, BLACK, score_rect)
+            pygame.draw.rect(screen, BLACK, high_rect)
+            draw_score(score, high_score)
+            dirty.append(score_rect)
+            dirty.append(high_rect)
+            prev_score, prev_high = score, high_score
+
+        # Push only the changed rects instead of flipping the whole frame
+        pygame.display.update(dirty)
         clock.tick(10)  # Adjust speed if needed
 
+    # Persist the record once at game over instead of syscalling inside
+    # the loop on every record-beating fruit
+    if high_score > saved_high:
+        save_high_score(high_score)
+
     pygame.quit()
 
 